@@ -0,0 +1,226 @@
+# =============================================================================
+# APPLY RAW DATA CONTRACT
+# =============================================================================
+# - Enforce the raw data contract on validated event fact data
+# - Quarantine-first: every rule contributes a row mask, the frame is
+#   filtered exactly once
+# - Designed for deterministic execution in CI/CD pipelines
+
+
+import os
+import sys
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from validate_raw_data import (
+    PARTITIONS,
+    RAW_DATA_BASE_PATH,
+    REQUIRED_TIMESTAMPS,
+    TABLE_CONFIG,
+    init_report,
+    load_logical_table,
+    log_error,
+    log_info,
+    parse_required_timestamps,
+    scan_partition_files,
+)
+
+
+CONTRACTED_DATA_BASE_PATH = 'data/contracted'
+
+
+# ------------------------------------------------------------
+# CONTRACT RULES
+# ------------------------------------------------------------
+# Each rule returns a boolean keep-mask over the frame's rows. Rules
+# never filter the frame themselves: all masks are ANDed together and
+# applied in a single materialization.
+
+def deduplicate_exact_events(df: pd.DataFrame) -> np.ndarray:
+
+    """
+    Keep the first occurrence of fully identical rows.
+    """
+
+    return ~df.duplicated().to_numpy()
+
+
+def remove_unparsable_timestamps(parsed: Dict[str, pd.Series]) -> np.ndarray:
+
+    """
+    Keep rows whose required timestamps all parsed.
+
+    Works on the datetime columns already parsed during validation, so
+    the raw strings are never tokenized a second time.
+    """
+
+    # Copy: to_numpy() may return a read-only view under copy-on-write,
+    # and the mask is accumulated in place.
+    keep = parsed[REQUIRED_TIMESTAMPS[0]].notna().to_numpy().copy()
+    for col in REQUIRED_TIMESTAMPS[1:]:
+        np.logical_and(keep, parsed[col].notna().to_numpy(), out=keep)
+
+    return keep
+
+
+def remove_impossible_timestamps(parsed: Dict[str, pd.Series]) -> np.ndarray:
+
+    """
+    Keep rows whose event order is possible: approval and delivery never
+    precede purchase. NaT rows pass here; the unparsable-timestamp rule
+    owns them.
+    """
+
+    purchase_ts = parsed['order_purchase_timestamp'].to_numpy()
+    later_events = np.stack([
+        parsed['order_approved_at'].to_numpy(),
+        parsed['order_delivered_timestamp'].to_numpy(),
+    ])
+
+    return ~(later_events < purchase_ts).any(axis=0)
+
+
+# ------------------------------------------------------------
+# CONTRACT ENFORCEMENT
+# ------------------------------------------------------------
+
+def apply_raw_data_contract(df: pd.DataFrame,
+                            table_name: str,
+                            report: Dict[str, List[str]]
+                            ) -> pd.DataFrame:
+
+    """
+    Compose every contract rule into one keep-mask and filter once.
+
+    A single df.loc[keep] avoids the full-frame copy each sequential
+    `df = df[mask]` step would pay.
+    """
+
+    # Reuse the columns parsed during validation when the frames share a
+    # process; otherwise parse once here.
+    parsed = df.attrs.get('parsed_timestamps')
+    if parsed is None:
+        parsed = parse_required_timestamps(df)
+
+    keep = deduplicate_exact_events(df)
+    np.logical_and(keep, remove_unparsable_timestamps(parsed), out=keep)
+    np.logical_and(keep, remove_impossible_timestamps(parsed), out=keep)
+
+    dropped_count = len(df) - int(np.count_nonzero(keep))
+    log_info(f'{table_name}: contract quarantined {dropped_count} row(s), '
+             f'kept {len(df) - dropped_count}',
+             report)
+
+    contracted_df = df.loc[keep].reset_index(drop=True)
+
+    # Carry the parsed columns forward, aligned to the kept rows.
+    contracted_df.attrs['parsed_timestamps'] = {
+        col: ts[keep].reset_index(drop=True) for col, ts in parsed.items()
+    }
+
+    return contracted_df
+
+
+# ------------------------------------------------------------
+# OUTPUT
+# ------------------------------------------------------------
+
+def write_contracted_data(df: pd.DataFrame,
+                          partition: str,
+                          table_name: str,
+                          report: Dict[str, List[str]]
+                          ) -> None:
+
+    """
+    Emit contracted data as Zstd Parquet partitioned by purchase month.
+
+    Downstream assembly can then prune partitions and row groups on
+    timestamp filters instead of reading whole tables.
+    """
+
+    parsed = df.attrs.get('parsed_timestamps')
+    if parsed is None:
+        parsed = parse_required_timestamps(df)
+
+    purchase_ts = parsed['order_purchase_timestamp']
+
+    # The contract guarantees purchase timestamps parsed, so the derived
+    # partition key is always defined.
+    output_df = df.assign(
+        order_year_month=(purchase_ts.dt.year * 100 + purchase_ts.dt.month).astype('int32')
+    )
+
+    # The parsed-timestamp handoff is in-process only; it is not
+    # serializable into Parquet metadata.
+    output_df.attrs = {}
+
+    output_path = os.path.join(CONTRACTED_DATA_BASE_PATH, partition, table_name)
+
+    try:
+        ds.write_dataset(
+            pa.Table.from_pandas(output_df, preserve_index=False),
+            output_path,
+            format='parquet',
+            partitioning=['order_year_month'],
+            partitioning_flavor='hive',
+            existing_data_behavior='delete_matching',
+            file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+            max_rows_per_group=1_000_000,
+        )
+
+    except Exception as e:
+        log_error(f'{table_name}: failed to write contracted data to {output_path}: {e}', report)
+
+        return
+
+    log_info(f'{table_name}: wrote {len(output_df)} contracted row(s) to {output_path}', report)
+
+
+# ------------------------------------------------------------
+# MAIN EXECUTION
+# ------------------------------------------------------------
+
+def main() -> None:
+    report = init_report()
+
+    for partition in PARTITIONS:
+        partition_path = os.path.join(RAW_DATA_BASE_PATH, partition)
+        partition_files = scan_partition_files(partition_path)
+
+        for table_name, config in TABLE_CONFIG.items():
+            if config['role'] != 'event_fact':
+
+                continue
+
+            df = load_logical_table(partition_path, table_name, report,
+                                    schema=config.get('schema'),
+                                    csv_files=partition_files[table_name])
+            if df is None:
+
+                continue
+
+            missing_ts_columns = [c for c in REQUIRED_TIMESTAMPS if c not in df.columns]
+            if missing_ts_columns:
+                log_error(f'{table_name}: missing required timestamp column(s): {missing_ts_columns}', report)
+
+                continue
+
+            contracted_df = apply_raw_data_contract(df, table_name, report)
+            write_contracted_data(contracted_df, partition, table_name, report)
+
+    if report['errors']:
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
+
+
+# =============================================================================
+# END OF SCRIPT
+# =============================================================================
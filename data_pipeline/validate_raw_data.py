@@ -8,9 +8,15 @@
 
 import os
 import sys
-import glob
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 # ------------------------------------------------------------
@@ -25,26 +31,65 @@ PARTITIONS = ['train']
 if VALIDATE_TEST:
     PARTITIONS.append('test')
 
+# Timestamp columns stay Utf8 at load time: validation owns timestamp
+# parsing and must see raw values to count unparsable entries.
 TABLE_CONFIG = {
     'df_Orders': {
         'role': 'event_fact',
-        'primary_key': ['order_id']
+        'primary_key': ['order_id'],
+        'schema': {
+            'order_id': pl.Utf8,
+            'customer_id': pl.Utf8,
+            'order_status': pl.Utf8,
+            'order_purchase_timestamp': pl.Utf8,
+            'order_approved_at': pl.Utf8,
+            'order_delivered_timestamp': pl.Utf8,
+            'order_estimated_delivery_date': pl.Utf8,
+        }
     },
     'df_OrderItems': {
         'role': 'transaction_detail',
-        'primary_key': ['order_id']
+        'primary_key': ['order_id'],
+        'schema': {
+            'order_id': pl.Utf8,
+            'product_id': pl.Utf8,
+            'seller_id': pl.Utf8,
+            'price': pl.Float32,
+            'shipping_charges': pl.Float32,
+        }
     },
     'df_Customers': {
         'role': 'entity_reference',
-        'primary_key': ['customer_id']
+        'primary_key': ['customer_id'],
+        'schema': {
+            'customer_id': pl.Utf8,
+            'customer_zip_code_prefix': pl.Int32,
+            'customer_city': pl.Utf8,
+            'customer_state': pl.Utf8,
+        }
     },
     'df_payments': {
         'role': 'transaction_detail',
-        'primary_key': ['order_id', 'payment_sequential']
+        'primary_key': ['order_id', 'payment_sequential'],
+        'schema': {
+            'order_id': pl.Utf8,
+            'payment_sequential': pl.Int16,
+            'payment_type': pl.Utf8,
+            'payment_installments': pl.Int16,
+            'payment_value': pl.Float32,
+        }
     },
     'df_products': {
         'role': 'entity_reference',
-        'primary_key': ['product_id']
+        'primary_key': ['product_id'],
+        'schema': {
+            'product_id': pl.Utf8,
+            'product_category_name': pl.Utf8,
+            'product_weight_g': pl.Float32,
+            'product_length_cm': pl.Float32,
+            'product_height_cm': pl.Float32,
+            'product_width_cm': pl.Float32,
+        }
     },
 }
 
@@ -62,42 +107,104 @@ def init_report() -> Dict[str, List[str]]:
     }
 
 
+# Tables are loaded and validated concurrently; the lock keeps each log
+# line atomic and the report lists safe to append from worker threads.
+REPORT_LOCK = threading.Lock()
+
+
 def log_info(message: str, report: Dict[str, List[str]]) -> None:
-    print(f'[INFO] {message}')
-    report['info'].append(message)
+    with REPORT_LOCK:
+        print(f'[INFO] {message}')
+        report['info'].append(message)
 
 
 def log_warning(message: str, report: Dict[str, List[str]]) -> None:
-    print(f'[WARNING] {message}')
-    report['warnings'].append(message)
+    with REPORT_LOCK:
+        print(f'[WARNING] {message}')
+        report['warnings'].append(message)
 
 
 def log_error(message: str, report: Dict[str, List[str]]) -> None:
-    print(f'[ERROR] {message}')
-    report['errors'].append(message)
+    with REPORT_LOCK:
+        print(f'[ERROR] {message}')
+        report['errors'].append(message)
 
 
 # ------------------------------------------------------------
 # BASE VALIDATIONS (ALL TABLES)
 # ------------------------------------------------------------
 
-def run_base_validations(df: pd.DataFrame,
-                         table_name: str,
-                         primary_key: List[str],
-                         report: Dict[str, List[str]]
-                         ) -> None:
+def base_validation_exprs(primary_key: List[str]) -> List[pl.Expr]:
+
+    """
+    Scalar aggregate expressions for the base structural validations:
+    null-key row count and distinct primary-key count.
+    """
+
+    # Single-column keys (df_Orders, df_Customers, df_products) skip the
+    # horizontal reduction and struct packing entirely; only composite
+    # keys pay for them.
+    if len(primary_key) == 1:
+        key = pl.col(primary_key[0])
+        pk_null_expr = key.is_null().sum().alias('pk_null_count')
+        distinct_pk_expr = key.n_unique().alias('distinct_pk_count')
+
+    else:
+        pk_null_expr = (
+            pl.any_horizontal([pl.col(col).is_null() for col in primary_key])
+            .sum()
+            .alias('pk_null_count')
+        )
+        distinct_pk_expr = pl.struct(primary_key).n_unique().alias('distinct_pk_count')
+
+    return [pk_null_expr, distinct_pk_expr]
+
+
+# ------------------------------------------------------------
+# TRANSACTION DETAIL VALIDATIONS
+# ------------------------------------------------------------
+
+def transaction_detail_exprs(frame: pl.DataFrame) -> List[pl.Expr]:
+
+    """
+    Scalar aggregate expressions for the transaction detail
+    validations: negative-value count per numeric column.
+    """
+
+    return [
+        (pl.col(col) < 0).sum().alias(f'negative_count:{col}')
+        for col, dtype in frame.schema.items()
+        if dtype.is_numeric()
+    ]
+
+
+# ------------------------------------------------------------
+# FUSED PER-TABLE VALIDATIONS
+# ------------------------------------------------------------
+
+def run_fused_table_validations(df: pd.DataFrame,
+                                table_name: str,
+                                config: Dict,
+                                report: Dict[str, List[str]]
+                                ) -> None:
     """
-    Base structural validations.
-    
+    Base structural and role-specific validations for one table.
+
+    Structural checks that need no data pass (emptiness, column names)
+    run first; every scalar aggregate the table needs is then collected
+    in a single fused Polars pass instead of one scan per check.
+
     Stops if structure is broken.
     """
-    
+
+    primary_key = config['primary_key']
+
     if df.empty:
         log_error(f'{table_name}: dataset is empty', report)
 
         return
 
-    duplicate_columns = df.columns[df.columns.duplicated()].tolist()
+    duplicate_columns = [col for col, n in Counter(df.columns).items() if n > 1]
     if duplicate_columns:
         log_error(f'{table_name}: duplicate column names detected: {duplicate_columns}', report)
 
@@ -105,105 +212,137 @@ def run_base_validations(df: pd.DataFrame,
     if missing_pk_columns:
         log_error(f'{table_name}: missing primary key column(s): {missing_pk_columns}', report)
 
-        return
+    frame = pl.from_pandas(df)
+
+    exprs: List[pl.Expr] = []
+    if not missing_pk_columns:
+        exprs.extend(base_validation_exprs(primary_key))
 
-    pk_null_count = df[primary_key].isnull().any(axis=1).sum()
-    if pk_null_count > 0:
-        log_error(f'{table_name}: {pk_null_count} row(s) with null primary key values', report)
+    if config['role'] == 'transaction_detail':
+        exprs.extend(transaction_detail_exprs(frame))
 
+    counts = frame.lazy().select(exprs).collect().row(0, named=True) if exprs else {}
 
-    duplicate_pk_count = df.duplicated(subset=primary_key).sum()
-    if duplicate_pk_count > 0:
-        log_error(f'{table_name}: {duplicate_pk_count} duplicated primary key value(s)', report)
+    if not missing_pk_columns:
+        pk_null_count = int(counts['pk_null_count'])
+        if pk_null_count > 0:
+            log_error(f'{table_name}: {pk_null_count} row(s) with null primary key values', report)
+
+
+        # Rows minus distinct keys equals the duplicated() row count.
+        duplicate_pk_count = len(df) - int(counts['distinct_pk_count'])
+        if duplicate_pk_count > 0:
+            log_error(f'{table_name}: {duplicate_pk_count} duplicated primary key value(s)', report)
+
+    if config['role'] == 'transaction_detail':
+        for key, negative_count in counts.items():
+            if not key.startswith('negative_count:'):
+
+                continue
+
+            if negative_count > 0:
+                col = key.split(':', 1)[1]
+                log_error(f'{table_name}: {negative_count} negative value(s) in numeric column `{col}`', report)
+
+                break
 
 
 # ------------------------------------------------------------
 # EVENT FACT VALIDATIONS
 # ------------------------------------------------------------
 
+REQUIRED_TIMESTAMPS = [
+    'order_purchase_timestamp',
+    'order_approved_at',
+    'order_delivered_timestamp',
+    'order_estimated_delivery_date',
+]
+
+
+def parse_required_timestamps(df: pd.DataFrame) -> Dict[str, pd.Series]:
+
+    """
+    Parse every required timestamp column in one to_datetime call.
+
+    The columns are stacked into a single series and parsed with one
+    format-pinned pass instead of paying format detection per column;
+    unparsable values become NaT. Shared with contract enforcement.
+    """
+
+    row_count = len(df)
+    stacked = pd.concat([df[col] for col in REQUIRED_TIMESTAMPS], ignore_index=True)
+    parsed_stacked = pd.to_datetime(stacked, format='ISO8601', errors='coerce', cache=True)
+
+    parsed = {}
+    for position, col in enumerate(REQUIRED_TIMESTAMPS):
+        ts = parsed_stacked.iloc[position * row_count:(position + 1) * row_count]
+        parsed[col] = ts.reset_index(drop=True)
+
+    return parsed
+
+
 def run_event_fact_validations(df: pd.DataFrame,
                                table_name: str,
                                report: Dict[str, List[str]]
-                               ) -> None:
+                               ) -> Optional[Dict[str, pd.Series]]:
     """
     Event fact validations.
 
     Stops if timeline integrity is broken.
-    """
 
-    required_timestamps = [
-        'order_purchase_timestamp',
-        'order_approved_at',
-        'order_delivered_timestamp',
-        'order_estimated_delivery_date',
-    ]
+    Returns the parsed datetime64 columns so downstream contract
+    enforcement can reuse them instead of re-parsing the raw strings;
+    None when the required columns are missing.
+    """
 
-    missing_ts_columns = [c for c in required_timestamps if c not in df.columns]
+    missing_ts_columns = [c for c in REQUIRED_TIMESTAMPS if c not in df.columns]
     if missing_ts_columns:
         log_error(f'{table_name}: missing required timestamp column(s): {missing_ts_columns}', report)
 
-        return
+        return None
 
     # Timestamps completeness
-    parsed = {}
+    parsed = parse_required_timestamps(df)
     parsing_failed = False
 
-    for col in required_timestamps:
-        ts = pd.to_datetime(df[col], errors='coerce')
-        parsed[col] = ts
+    for col in REQUIRED_TIMESTAMPS:
+        ts = parsed[col]
 
-        invalid_count = ts.isna().sum()
+        invalid_count = np.count_nonzero(ts.isna().to_numpy())
         if invalid_count > 0:
             parsing_failed = True
             log_error(f'{table_name}: {invalid_count} unparsable timestamp value(s) in `{col}`',report)
 
     if parsing_failed:
 
-        return
+        return parsed
 
     purchase_ts = parsed['order_purchase_timestamp']
     approved_ts = parsed['order_approved_at']
     delivered_ts = parsed['order_delivered_timestamp']
 
 
+    # Both ordering checks compare against purchase, so they run as one
+    # comparison over a stacked 2D datetime64 array.
+    later_events = np.stack([approved_ts.to_numpy(), delivered_ts.to_numpy()])
+    invalid_approval, invalid_delivery = np.count_nonzero(
+        later_events < purchase_ts.to_numpy(), axis=1
+    )
+
     # Approval before Purchase
-    invalid_approval = (approved_ts < purchase_ts).sum()
     if invalid_approval > 0:
         log_error(f'{table_name}: {invalid_approval} record(s) where approval precedes purchase',report)
 
-        return
+        return parsed
 
     # Delivery before Purchase
-    invalid_delivery = (delivered_ts < purchase_ts).sum()
     if invalid_delivery > 0:
         log_error(f'{table_name}: {invalid_delivery} record(s) where delivery precedes purchase',report)
-        
-        return
-
 
-# ------------------------------------------------------------
-# TRANSACTION DETAIL VALIDATIONS
-# ------------------------------------------------------------ 
-
-def run_transaction_detail_validations(df: pd.DataFrame,
-                                       table_name: str,
-                                       report: Dict[str, List[str]]
-                                       ) -> None:
-    """
-    Transaction detail validations.
-
-    Stops if aggregations would be corrupted.
-    """
-    
-    numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
+        return parsed
 
-    for col in numeric_columns:
-        negative_count = (df[col] < 0).sum()
-        if negative_count > 0:
-            log_error(f'{table_name}: {negative_count} negative value(s) in numeric column `{col}`', report)
+    return parsed
 
-            return
-    
 
 # ------------------------------------------------------------
 # CROSS-TABLE VALIDATIONS
@@ -230,20 +369,29 @@ def run_cross_table_validations(tables: Dict[str, pd.DataFrame],
     order_items_df = tables['df_OrderItems']
     payments_df = tables['df_payments']
 
-    # Orders PK reference
-    order_id_set = set(orders_df['order_id'].dropna().unique())
+    # Orders PK reference, hashed once in Arrow instead of boxing every
+    # id into a Python set. Null child ids never match and therefore
+    # count as orphans, same as the old set-based check.
+    parent_order_ids = pa.array(orders_df['order_id'].dropna().unique(), from_pandas=True)
+
+    def count_orphans(child_ids: pd.Series) -> int:
+        child_arr = pa.array(child_ids, from_pandas=True)
+        matched = pc.sum(pc.cast(pc.is_in(child_arr, value_set=parent_order_ids),
+                                 pa.int64())).as_py() or 0
+
+        return len(child_arr) - matched
 
     # OrderItems to Orders integrity
-    orphan_items = ~order_items_df['order_id'].isin(order_id_set)
-    if orphan_items.any():
-        log_error(f'df_OrderItems: {orphan_items.sum()} orphan record(s) referencing non-existent order_id', report)
-        
+    orphan_item_count = count_orphans(order_items_df['order_id'])
+    if orphan_item_count > 0:
+        log_error(f'df_OrderItems: {orphan_item_count} orphan record(s) referencing non-existent order_id', report)
+
         return
 
     # Payments to Orders integrity
-    orphan_payments = ~payments_df['order_id'].isin(order_id_set)
-    if orphan_payments.any():
-        log_error(f'df_payments: {orphan_payments.sum()} orphan record(s) referencing non-existent order_id', report)
+    orphan_payment_count = count_orphans(payments_df['order_id'])
+    if orphan_payment_count > 0:
+        log_error(f'df_payments: {orphan_payment_count} orphan record(s) referencing non-existent order_id', report)
 
         return
 
@@ -251,51 +399,147 @@ def run_cross_table_validations(tables: Dict[str, pd.DataFrame],
 # Input-Output Helpers
 # ------------------------------------------------------------
 
-def load_csv_file(csv_path: str, table_name: str, 
-                  report: Dict[str, List[str]]
-                  ) -> Optional[pd.DataFrame]:
+def scan_partition_files(partition_path: str) -> Dict[str, List[os.DirEntry]]:
+
+    """
+    Scan a partition directory once and bucket its CSV files by the
+    logical table whose name prefixes them.
+
+    The returned DirEntry objects carry cached stat results, so one
+    directory scan replaces the per-table glob and per-file stat calls.
+    """
+
+    by_table: Dict[str, List[os.DirEntry]] = {name: [] for name in TABLE_CONFIG}
+
     try:
-        df = pd.read_csv(csv_path)
-        log_info(f'Loaded {table_name} file: {os.path.basename(csv_path)} ({len(df)} rows)', report)
+        entries = list(os.scandir(partition_path))
+
+    except OSError:
+
+        return by_table
+
+    for entry in sorted(entries, key=lambda e: e.name):
+        if not entry.is_file() or not entry.name.endswith('.csv'):
+
+            continue
+
+        for table_name in TABLE_CONFIG:
+            if entry.name.startswith(table_name):
+                by_table[table_name].append(entry)
+
+    return by_table
+
+
+def table_cache_path(partition_path: str, table_name: str) -> str:
+
+    partition = os.path.relpath(partition_path, RAW_DATA_BASE_PATH)
+
+    return os.path.join(RAW_DATA_BASE_PATH, '.cache', partition, f'{table_name}.parquet')
+
+
+def load_cached_table(cache_path: str,
+                      csv_files: List[os.DirEntry],
+                      table_name: str,
+                      report: Dict[str, List[str]]
+                      ) -> Optional[pd.DataFrame]:
+
+    """
+    Return the cached Parquet copy of a logical table, or None if the
+    cache is missing or any source CSV has been modified since it was
+    written.
+    """
+
+    if not os.path.exists(cache_path):
+
+        return None
+
+    newest_source = max(entry.stat().st_mtime for entry in csv_files)
+    if newest_source > os.path.getmtime(cache_path):
+
+        return None
+
+    try:
+        df = pd.read_parquet(cache_path, engine='pyarrow')
 
-        return df
-    
     except Exception as e:
-        log_error(f'Failed to load {table_name} file {csv_path}: {e}', report)
+        log_warning(f'{table_name}: failed to read parquet cache {cache_path}: {e}', report)
 
         return None
 
+    log_info(f'{table_name}: loaded {len(df)} rows from parquet cache', report)
+
+    return df
+
+
+def write_table_cache(combined: pl.DataFrame,
+                      cache_path: str,
+                      table_name: str,
+                      report: Dict[str, List[str]]
+                      ) -> None:
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        combined.write_parquet(cache_path, compression='zstd')
+
+    except Exception as e:
+        log_warning(f'{table_name}: failed to write parquet cache {cache_path}: {e}', report)
+
 
 def load_logical_table(partition_path: str,
                        table_name: str,
-                       report: Dict[str, List[str]]
+                       report: Dict[str, List[str]],
+                       schema: Optional[Dict[str, pl.DataType]] = None,
+                       csv_files: Optional[List[os.DirEntry]] = None
                        ) -> Optional[pd.DataFrame]:
-    
+
     """
     Load and concatenate all CSV files belonging to a logical table.
     Files are identified by filename prefix: <table_name>*.csv
+
+    Files are scanned lazily with Polars and collected once into a
+    single frame; `schema` pins per-column dtypes so no inference pass
+    is paid per file.
+
+    The combined frame is cached as Parquet next to the raw data; later
+    runs read the cache and skip CSV tokenization entirely as long as no
+    source file is newer than the cache.
     """
 
     pattern = os.path.join(partition_path, f'{table_name}*.csv')
-    csv_files = glob.glob(pattern)
+
+    if csv_files is None:
+        csv_files = scan_partition_files(partition_path)[table_name]
 
     if not csv_files:
         log_error(f'{table_name}: no files found matching pattern {pattern}', report)
-        
+
         return None
 
-    dfs = []
-    for csv_path in csv_files:
-        df = load_csv_file(csv_path, table_name, report)
-        if df is not None:
-            dfs.append(df)
+    cache_path = table_cache_path(partition_path, table_name)
+    cached_df = load_cached_table(cache_path, csv_files, table_name, report)
 
-    if not dfs:
-        log_error(f'{table_name}: all matching files failed to load', report)
+    if cached_df is not None:
+
+        return cached_df
+
+    try:
+        combined = (
+            pl.scan_csv([entry.path for entry in csv_files], schema_overrides=schema)
+            .collect(engine='streaming')
+        )
+
+    except Exception as e:
+        log_error(f'{table_name}: failed to load file(s) matching {pattern}: {e}', report)
 
         return None
 
-    combined_df = pd.concat(dfs, ignore_index=True)
+    write_table_cache(combined, cache_path, table_name, report)
+
+    # Hand off through Arrow explicitly: to_arrow() is zero-copy and
+    # self_destruct releases each Arrow buffer as its pandas block is
+    # built, so peak memory stays near one copy of the table.
+    combined_df = combined.to_arrow().to_pandas(self_destruct=True, split_blocks=True)
+
     log_info(f'{table_name}: combined {len(csv_files)} file(s) into '
              f'{len(combined_df)} rows',
              report)
@@ -307,35 +551,124 @@ def load_logical_table(partition_path: str,
 # MAIN EXECUTION
 # ------------------------------------------------------------
 
-def main() -> None:
-    report = init_report()
+# A partition whose estimated in-memory footprint exceeds this share of
+# available memory is processed one table at a time instead of all
+# tables in flight at once.
+MEMORY_BUDGET_FRACTION = 0.4
 
-    for partition in PARTITIONS:
-        partition_path = os.path.join(RAW_DATA_BASE_PATH, partition)
-        tables: Dict[str, pd.DataFrame] = {}
+# Rough in-memory expansion of CSV bytes once loaded and validated.
+CSV_EXPANSION_FACTOR = 2.0
 
-        for table_name, config in TABLE_CONFIG.items():
-            csv_path = os.path.join(partition_path, f'{table_name}.csv')
 
-            if not os.path.exists(csv_path):
-                log_error(f'Missing file: {csv_path}', report)
+def available_memory_bytes() -> Optional[int]:
 
-                continue
+    try:
 
-            df = load_logical_table(partition_path, table_name, report)
-            if df is None:
-                
-                continue
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
 
-            run_base_validations(df, table_name, config['primary_key'], report)
+    except (AttributeError, OSError, ValueError):
 
-            if config['role'] == 'event_fact':
-                run_event_fact_validations(df, table_name, report)
+        return None
+
+
+def select_max_workers(partition_files: Dict[str, List[os.DirEntry]]) -> int:
+
+    """
+    Memory-aware strategy selection: load every table concurrently when
+    the partition comfortably fits in memory, otherwise keep a single
+    table in flight so the streaming collect stays within budget.
+    """
+
+    available = available_memory_bytes()
+    if available is None:
+
+        return len(TABLE_CONFIG)
+
+    estimated = CSV_EXPANSION_FACTOR * sum(
+        entry.stat().st_size
+        for csv_files in partition_files.values()
+        for entry in csv_files
+    )
+
+    if estimated > available * MEMORY_BUDGET_FRACTION:
+
+        return 1
+
+    return len(TABLE_CONFIG)
+
+
+def load_and_validate_table(partition_path: str,
+                            table_name: str,
+                            config: Dict,
+                            report: Dict[str, List[str]],
+                            csv_files: List[os.DirEntry]
+                            ) -> Optional[pd.DataFrame]:
+
+    """
+    Load one logical table and run its per-table validations.
 
-            elif config['role'] == 'transaction_detail':
-                run_transaction_detail_validations(df, table_name, report)
+    Safe to run from a worker thread: all report writes go through the
+    locked log helpers.
+    """
+
+    csv_path = os.path.join(partition_path, f'{table_name}.csv')
+
+    if not any(entry.path == csv_path for entry in csv_files):
+        log_error(f'Missing file: {csv_path}', report)
+
+        return None
+
+    df = load_logical_table(partition_path, table_name, report,
+                            schema=config.get('schema'),
+                            csv_files=csv_files)
+    if df is None:
+
+        return None
+
+    run_fused_table_validations(df, table_name, config, report)
+
+    # Timestamp parsing stays in pandas: the parsed columns are handed
+    # to the contract-enforcement stage so it never re-tokenizes the raw
+    # timestamp strings.
+    if config['role'] == 'event_fact':
+        parsed_timestamps = run_event_fact_validations(df, table_name, report)
+
+        if parsed_timestamps is not None:
+            df.attrs['parsed_timestamps'] = parsed_timestamps
+
+    return df
+
+
+def main() -> None:
+    report = init_report()
+
+    for partition in PARTITIONS:
+        partition_path = os.path.join(RAW_DATA_BASE_PATH, partition)
+        tables: Dict[str, pd.DataFrame] = {}
 
-            tables[table_name] = df
+        partition_files = scan_partition_files(partition_path)
+        max_workers = select_max_workers(partition_files)
+
+        if max_workers == 1:
+            log_info(f'{partition}: partition too large for concurrent loading, '
+                     'processing one table at a time',
+                     report)
+
+        # Per-table work is independent until the cross-table stage, and
+        # CSV I/O plus the pandas/pyarrow C paths release the GIL.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                table_name: executor.submit(load_and_validate_table,
+                                            partition_path, table_name,
+                                            config, report,
+                                            partition_files[table_name])
+                for table_name, config in TABLE_CONFIG.items()
+            }
+
+        for table_name, future in futures.items():
+            df = future.result()
+            if df is not None:
+                tables[table_name] = df
 
         run_cross_table_validations(tables, report)
 